@@ -131,7 +131,8 @@ UI_TEXT = {
         "guided_symptom_prompt": "Do you also have **{}**?", "guided_button": "Get Final Prediction",
         "no_more_questions": "No further questions to ask. Click below for your final diagnosis.",
         "result_header": "✨ Diagnosis Result", "diagnosis_sub": "🩺 Based on your answers, you may have **{}**",
-        "confidence_label": "Confidence Level", "about_sub": "📖 About", "precautions_sub": "🛡️ Suggested Precautions",
+        "confidence_label": "Confidence Level", "urgency_label": "Severity-Weighted Urgency",
+        "differential_sub": "🔍 Other Possible Conditions", "about_sub": "📖 About", "precautions_sub": "🛡️ Suggested Precautions",
         "no_description": "No description available.", "start_over": "Start Over",
         "thank_you": "Thank you for using the chatbot. Wishing you good health, **{}**!",
         "login_header": "Login", "username_label": "Username", "password_label": "Password",
@@ -169,6 +170,8 @@ UI_TEXT = {
         "result_header": "✨ निदान परिणाम",
         "diagnosis_sub": "🩺 आपके उत्तरों के आधार पर, आपको **{}** हो सकता है",
         "confidence_label": "विश्वास स्तर",
+        "urgency_label": "गंभीरता-आधारित तात्कालिकता",
+        "differential_sub": "🔍 अन्य संभावित स्थितियाँ",
         "about_sub": "📖 के बारे में",
         "precautions_sub": "🛡️ सुझाए गए सावधानियां",
         "no_description": "कोई विवरण उपलब्ध नहीं है।",
@@ -249,6 +252,20 @@ def load_dictionaries():
         pass
     return description_list, precaution_dict
 
+@st.cache_data
+def load_severity():
+    # Keys drop spaces/underscores so CSV spellings like "foul_smell_ofurine" match the training columns
+    severity_dict = {}
+    try:
+        with open('MasterData/Symptom_severity.csv', encoding="utf-8") as csv_file:
+            reader = csv.reader(csv_file)
+            for row in reader:
+                if len(row) > 1 and row[1].strip().isdigit():
+                    severity_dict[re.sub(r"[\s_]+", "", row[0])] = int(row[1])
+    except Exception:
+        pass
+    return severity_dict
+
 training, _ = load_data()
 description_list, precautionDictionary = load_dictionaries()
 cols = list(training.columns)
@@ -269,6 +286,20 @@ def train_model(_x_train, _y_train):
 model = train_model(x_train, y_train)
 symptoms_dict = {symptom: index for index, symptom in enumerate(x.columns)}
 
+@st.cache_resource
+def build_severity_arrays(_training, _symptoms, _classes):
+    severity_dict = load_severity()
+    if not severity_dict:
+        return None, None
+    # Severity weights aligned with symptoms_dict (unknown symptoms weigh 0)
+    severity_weights = np.array([severity_dict.get(re.sub(r"[\s_]+", "", symptom), 0) for symptom in _symptoms], dtype=np.float32)
+    # Mean severity of each disease's symptom profile, aligned with le.classes_ / predict_proba columns
+    disease_profiles = _training.groupby('prognosis')[list(_symptoms)].max().reindex(_classes).to_numpy(dtype=np.float32)
+    disease_severity = (disease_profiles @ severity_weights) / np.maximum(disease_profiles.sum(axis=1), 1)
+    return severity_weights, disease_severity
+
+severity_weights, disease_severity = build_severity_arrays(training, symptoms_dict, le.classes_)
+
 
 # ------------------ Core Chatbot Functions ------------------
 def call_gemini_api(payload):
@@ -301,12 +332,13 @@ def translate_to_english(text):
     return result.get('translated_text', '') if result else ""
 
 @st.cache_data(show_spinner=False)
-def translate_result_texts(disease, description, precautions, target_lang):
+def translate_result_texts(disease, description, precautions, alternatives, target_lang):
     if target_lang == 'en':
-        return disease, description, precautions
+        return disease, description, precautions, alternatives
 
     precaution_json_str = json.dumps(precautions)
-    prompt = f"""Translate the values in this JSON object to the language with code '{target_lang}'. Return a JSON object with the same structure. Input: {{ "disease": "{disease}", "description": "{description}", "precautions": {precaution_json_str} }}"""
+    alternatives_json_str = json.dumps(alternatives)
+    prompt = f"""Translate the values in this JSON object to the language with code '{target_lang}'. Return a JSON object with the same structure. Input: {{ "disease": "{disease}", "description": "{description}", "precautions": {precaution_json_str}, "alternatives": {alternatives_json_str} }}"""
     
     payload = {
         "contents": [{"parts": [{"text": prompt}]}],
@@ -317,7 +349,8 @@ def translate_result_texts(disease, description, precautions, target_lang):
                 "properties": {
                     "disease": {"type": "STRING"},
                     "description": {"type": "STRING"},
-                    "precautions": {"type": "ARRAY", "items": {"type": "STRING"}}
+                    "precautions": {"type": "ARRAY", "items": {"type": "STRING"}},
+                    "alternatives": {"type": "ARRAY", "items": {"type": "STRING"}}
                 }
             }
         },
@@ -325,8 +358,11 @@ def translate_result_texts(disease, description, precautions, target_lang):
     
     translated_data = call_gemini_api(payload)
     if translated_data:
-        return translated_data.get('disease', disease), translated_data.get('description', description), translated_data.get('precautions', precautions)
-    return disease, description, precautions
+        translated_alternatives = translated_data.get('alternatives', alternatives)
+        if not isinstance(translated_alternatives, list) or len(translated_alternatives) != len(alternatives):
+            translated_alternatives = alternatives
+        return translated_data.get('disease', disease), translated_data.get('description', description), translated_data.get('precautions', precautions), translated_alternatives
+    return disease, description, precautions, alternatives
 
 
 def extract_symptoms(user_input, all_symptoms):
@@ -341,17 +377,26 @@ def extract_symptoms(user_input, all_symptoms):
             extracted.append(matches[0])
     return list(set(extracted))
 
-def predict_disease(symptoms_list):
+def predict_disease(symptoms_list, top_k=3):
+    """Returns the top disease, its confidence, the top-k differential and a severity-weighted urgency score."""
     input_vector = np.zeros(len(symptoms_dict))
     for symptom in symptoms_list:
         if symptom in symptoms_dict:
             input_vector[symptoms_dict[symptom]] = 1
     input_df = pd.DataFrame([input_vector], columns=symptoms_dict.keys())
     pred_proba = model.predict_proba(input_df)[0]
-    pred_class = np.argmax(pred_proba)
-    disease = le.inverse_transform([pred_class])[0]
-    confidence = round(pred_proba[pred_class] * 100, 2)
-    return disease, confidence
+    # model.classes_ maps proba columns to label ids; the split may have dropped a rare class
+    top_idx = np.argsort(-pred_proba, kind="stable")[:top_k]
+    # Keep the argmax, drop zero-probability filler from the remaining slots
+    top_idx = top_idx[(pred_proba[top_idx] > 0) | (top_idx == top_idx[0])]
+    top_diseases = le.inverse_transform(model.classes_[top_idx])
+    differential = [(d, round(p * 100, 2)) for d, p in zip(top_diseases, pred_proba[top_idx])]
+    # Expected disease severity (1-7) under the predicted distribution; None if the weights failed to load
+    urgency = None
+    if disease_severity is not None:
+        urgency = round(float(pred_proba @ disease_severity[model.classes_]), 2)
+    disease, confidence = differential[0]
+    return disease, confidence, differential, urgency
 
 def call_tts_api(text, lang_code):
     try:
@@ -531,7 +576,7 @@ else:
                     else:
                         st.session_state.symptoms_list = detected_symptoms
                         st.success(lang_texts["detected_symptoms"].format(', '.join(st.session_state.symptoms_list).replace('_', ' ')))
-                        initial_disease, confidence = predict_disease(st.session_state.symptoms_list)
+                        initial_disease, confidence, _, _ = predict_disease(st.session_state.symptoms_list)
                         st.session_state.initial_prediction = {"disease": initial_disease, "confidence": confidence}
                         disease_symptoms = list(training[training['prognosis'] == initial_disease].iloc[0][:-1].index[training[training['prognosis'] == initial_disease].iloc[0][:-1] == 1])
                         st.session_state.guided_symptoms = [sym for sym in disease_symptoms if sym not in st.session_state.symptoms_list][:8]
@@ -556,15 +601,15 @@ else:
             if submit_guided:
                 with st.spinner(lang_texts["thinking"]):
                     st.session_state.symptoms_list.extend(new_symptoms)
-                    final_disease, final_confidence = predict_disease(st.session_state.symptoms_list)
-                    st.session_state.final_prediction = {"disease": final_disease, "confidence": final_confidence}
+                    final_disease, final_confidence, differential, urgency = predict_disease(st.session_state.symptoms_list)
+                    st.session_state.final_prediction = {"disease": final_disease, "confidence": final_confidence, "differential": differential, "urgency": urgency}
                     st.session_state.page = "result"
                     st.rerun()
         else:
             st.info(lang_texts["no_more_questions"])
             if st.button(lang_texts["guided_button"]):
-                final_disease, final_confidence = predict_disease(st.session_state.symptoms_list)
-                st.session_state.final_prediction = {"disease": final_disease, "confidence": final_confidence}
+                final_disease, final_confidence, differential, urgency = predict_disease(st.session_state.symptoms_list)
+                st.session_state.final_prediction = {"disease": final_disease, "confidence": final_confidence, "differential": differential, "urgency": urgency}
                 st.session_state.page = "result"
                 st.rerun()
 
@@ -583,8 +628,9 @@ else:
             precautions_en = precautionDictionary.get(disease, [])
             description_en = description_list.get(disease, lang_texts["no_description"])
             
-            translated_disease, translated_description, translated_precautions = translate_result_texts(
-                disease, description_en, precautions_en, st.session_state.lang
+            alternatives_en = [alt_disease for alt_disease, _ in final_pred["differential"][1:]]
+            translated_disease, translated_description, translated_precautions, translated_alternatives = translate_result_texts(
+                disease, description_en, precautions_en, alternatives_en, st.session_state.lang
             )
             
             # --- PROACTIVELY GENERATE AND CACHE AUDIO HERE ---
@@ -597,6 +643,12 @@ else:
         # Display results AFTER everything is ready
         st.subheader(lang_texts["diagnosis_sub"].format(translated_disease))
         st.metric(label=lang_texts["confidence_label"], value=f"{confidence}%")
+        if final_pred["urgency"] is not None:
+            st.metric(label=lang_texts["urgency_label"], value=f"{final_pred['urgency']} / 7")
+        if len(final_pred["differential"]) > 1:
+            st.subheader(lang_texts["differential_sub"])
+            for alt_disease, (_, alt_confidence) in zip(translated_alternatives, final_pred["differential"][1:]):
+                st.write(f"- {alt_disease} ({alt_confidence}%)")
         st.markdown("---")
         st.subheader(lang_texts["about_sub"])
         st.write(translated_description)